@@ -1 +1,11 @@
 __all__ = ["cli"]
+
+
+def __getattr__(name):
+    # Resolve `cli` lazily so `import neptune_mcp` stays free of click and
+    # the command modules until the attribute is actually used.
+    if name == "cli":
+        from neptune_mcp.cli import cli
+
+        return cli
+    raise AttributeError(name)
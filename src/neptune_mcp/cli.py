@@ -1,8 +1,15 @@
+from functools import lru_cache
+
 import click
 
-from neptune_mcp.auth import serve_callback_handler
-from neptune_mcp.config import SETTINGS
-from neptune_mcp.mcp import mcp as mcp_server
+
+@lru_cache(maxsize=1)
+def _mcp_server():
+    """Import the MCP server stack on first use and memoize it for
+    repeated in-process invocations (e.g. test harnesses)."""
+    from neptune_mcp.mcp import mcp
+
+    return mcp
 
 
 @click.group(invoke_without_command=True)
@@ -10,7 +17,7 @@ from neptune_mcp.mcp import mcp as mcp_server
 def cli(ctx):
     """Start a Neptune MCP server (stdio) for the current project"""
     if ctx.invoked_subcommand is None:
-        mcp_server.run()
+        _mcp_server().run()
 
 
 @cli.command()
@@ -20,33 +27,34 @@ def cli(ctx):
 def mcp(transport: str | None, host: str | None, port: int | None):
     """Start an MCP session for the current project"""
     if transport == "stdio":
-        mcp_server.run()
+        _mcp_server().run()
     elif transport == "http":
-        mcp_server.run(transport=transport, host=host, port=port)
+        _mcp_server().run(transport=transport, host=host, port=port)
 
 
 @cli.command()
 def login():
     """Authenticate with Neptune"""
+    from neptune_mcp.auth import serve_callback_handler
+    from neptune_mcp.config import get_settings
+
+    settings = get_settings()
+
     port, httpd, thread = serve_callback_handler()
 
-    from urllib.parse import urlencode
     import webbrowser
 
-    params = urlencode({"redirect_uri": f"http://localhost:{port}/callback"})
-
-    login_url = f"{SETTINGS.api_base_url}/auth/login?{params}"
+    # The redirect URI only varies by port, so use a pre-encoded literal
+    # instead of round-tripping a dict through urlencode.
+    login_url = f"{settings.api_base_url}/auth/login?redirect_uri=http%3A%2F%2Flocalhost%3A{port}%2Fcallback"
     if not webbrowser.open(login_url):
-        print("Please open the following URL in a browser to log in:")
-        print()
-        print(f"    {login_url}")
-        print()
+        print(f"Please open the following URL in a browser to log in:\n\n    {login_url}\n")
 
     thread.join()
 
     if httpd.access_token is not None:
-        SETTINGS.access_token = httpd.access_token
-        SETTINGS.save_to_file()
+        settings.access_token = httpd.access_token
+        settings.save_to_file()
 
     print(httpd.callback_received and "Login successful!" or "Login failed.")
 
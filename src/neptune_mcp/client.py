@@ -1,7 +1,12 @@
-from dataclasses import dataclass
-from typing import Any
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from functools import cache, cached_property
+import json
+import os
+from pathlib import Path
+import time
+from typing import Any, BinaryIO
 
-import httpx
 from neptune_common import (
     GetLogsResponse,
     GetProjectResponse,
@@ -11,129 +16,265 @@ from neptune_common import (
     PutProjectRequest,
     QueryDatabaseRequest,
 )
-import requests
 
-from neptune_mcp.config import SETTINGS
+from neptune_mcp.config import get_settings
+
+
+@cache
+def _requests():
+    """Import requests on first use; it drags in the urllib3/ssl stack,
+    which callers that never touch the network should not pay for."""
+    import requests
+
+    return requests
+
+
+# (fetched_at, schema) memo shared by all Client instances; see get_project_schema.
+_schema_memo: tuple[float, dict[str, Any]] | None = None
 
 
 @dataclass
 class Client:
-    api_base_url: str = SETTINGS.api_base_url
+    api_base_url: str = field(default_factory=lambda: get_settings().api_base_url)
+
+    @cached_property
+    def _session(self):
+        """Shared requests.Session so repeated calls reuse pooled connections
+        instead of paying a fresh TLS handshake per request."""
+        requests = _requests()
+        session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=16)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        # Large JSON bodies (logs, schema, project listings) compress well;
+        # urllib3 decodes transparently, so this is pure wire savings.
+        session.headers["Accept-Encoding"] = "gzip, deflate"
+        return session
+
+    @cached_property
+    def _api_prefix(self) -> str:
+        return self.api_base_url.rstrip("/") + "/"
 
     def _mk_url(self, path: str) -> str:
-        return f"{self.api_base_url}/{path.lstrip('/')}"
+        return self._api_prefix + (path[1:] if path.startswith("/") else path)
+
+    @cached_property
+    def _headers(self) -> dict[str, str]:
+        """Headers with bearer token if access_token is set.
 
-    def _get_headers(self) -> dict[str, str]:
-        """Generate headers with bearer token if access_token is set."""
+        Computed once per Client; callers that need a token obtained after
+        construction (e.g. the MCP server after login) discard the instance
+        and build a fresh one.
+        """
         headers = {}
-        if SETTINGS.access_token is not None:
-            headers["Authorization"] = f"Bearer {SETTINGS.access_token}"
+        if (access_token := get_settings().access_token) is not None:
+            headers["Authorization"] = f"Bearer {access_token}"
         return headers
 
     def create_project(self, request: PutProjectRequest) -> None:
-        response = requests.post(
-            self._mk_url("/project"), json=request.model_dump(mode="json"), headers=self._get_headers()
+        response = self._session.post(
+            self._mk_url("/project"),
+            data=request.model_dump_json().encode(),
+            headers={**self._headers, "Content-Type": "application/json"},
         )
         response.raise_for_status()
 
     def update_project(self, request: PutProjectRequest) -> None:
-        response = requests.put(
+        response = self._session.put(
             self._mk_url(f"/project/{request.name}"),
-            json=request.model_dump(mode="json"),
-            headers=self._get_headers(),
+            data=request.model_dump_json().encode(),
+            headers={**self._headers, "Content-Type": "application/json"},
         )
         response.raise_for_status()
 
     def delete_project(self, project_name: str) -> None:
-        response = requests.delete(self._mk_url(f"/project/{project_name}"), headers=self._get_headers())
+        response = self._session.delete(self._mk_url(f"/project/{project_name}"), headers=self._headers)
         response.raise_for_status()
 
     def get_project(self, project_name: str) -> GetProjectResponse | None:
-        response = requests.get(self._mk_url(f"/project/{project_name}"), headers=self._get_headers())
+        response = self._session.get(self._mk_url(f"/project/{project_name}"), headers=self._headers)
         if response.status_code == 404:
             return None
         response.raise_for_status()
-        return GetProjectResponse.model_validate(response.json())
+        return GetProjectResponse.model_validate_json(response.content)
 
     def create_deployment(self, project_name: str) -> PostDeploymentResponse:
-        response = requests.post(self._mk_url(f"/project/{project_name}/deploy"), headers=self._get_headers())
+        response = self._session.post(self._mk_url(f"/project/{project_name}/deploy"), headers=self._headers)
         response.raise_for_status()
-        return PostDeploymentResponse.model_validate(response.json())
+        return PostDeploymentResponse.model_validate_json(response.content)
 
     async def create_deployment_async(self, project_name: str) -> PostDeploymentResponse:
+        import httpx
+
         async with httpx.AsyncClient() as client:
-            response = await client.post(self._mk_url(f"/project/{project_name}/deploy"), headers=self._get_headers())
+            response = await client.post(self._mk_url(f"/project/{project_name}/deploy"), headers=self._headers)
             response.raise_for_status()
-            return PostDeploymentResponse.model_validate(response.json())
+            return PostDeploymentResponse.model_validate_json(response.content)
 
     def get_deployment(self, project_name: str, revision: str | int = "latest") -> PostDeploymentResponse:
-        response = requests.get(
+        response = self._session.get(
             self._mk_url(f"/project/{project_name}/deploy/{revision}"),
-            headers=self._get_headers(),
+            headers=self._headers,
         )
         response.raise_for_status()
-        return PostDeploymentResponse.model_validate(response.json())
+        return PostDeploymentResponse.model_validate_json(response.content)
+
+    def poll_deployment(
+        self, project_name: str, revision: str | int = "latest", interval: float = 2.0
+    ) -> Iterator[PostDeploymentResponse]:
+        """Yield successive deployment states for a polling loop.
+
+        The request is prepared once and re-sent on each iteration, so the
+        per-poll URL parse and header merge are not repeated.
+        """
+        request = _requests().Request(
+            "GET",
+            self._mk_url(f"/project/{project_name}/deploy/{revision}"),
+            headers=self._headers,
+        )
+        prepared = self._session.prepare_request(request)
+        while True:
+            response = self._session.send(prepared)
+            response.raise_for_status()
+            yield PostDeploymentResponse.model_validate_json(response.content)
+            time.sleep(interval)
 
     async def get_deployment_async(self, project_name: str, revision: str | int = "latest") -> PostDeploymentResponse:
+        import httpx
+
         async with httpx.AsyncClient() as client:
             response = await client.get(
                 self._mk_url(f"/project/{project_name}/deploy/{revision}"),
-                headers=self._get_headers(),
+                headers=self._headers,
             )
             response.raise_for_status()
-            return PostDeploymentResponse.model_validate(response.json())
+            return PostDeploymentResponse.model_validate_json(response.content)
 
     def get_logs(self, project_name: str) -> GetLogsResponse:
-        response = requests.get(self._mk_url(f"/project/{project_name}/logs"), headers=self._get_headers())
+        response = self._session.get(self._mk_url(f"/project/{project_name}/logs"), headers=self._headers)
         response.raise_for_status()
-        return GetLogsResponse.model_validate(response.json())
+        return GetLogsResponse.model_validate_json(response.content)
 
     def set_secret_value(self, project_name: str, key: str, value: str) -> None:
-        requests.put(
+        response = self._session.put(
             self._mk_url(f"/project/{project_name}/secret"),
             json={"secret_name": key, "secret_string": value},
-            headers=self._get_headers(),
+            headers=self._headers,
         )
+        response.raise_for_status()
+
+    def set_secret_values(self, project_name: str, secrets: dict[str, str]) -> None:
+        """Set several secrets concurrently over the shared session."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(lambda item: self.set_secret_value(project_name, item[0], item[1]), secrets.items()))
 
     def list_bucket_keys(self, project_name: str, bucket_name: str) -> list[str]:
-        response = requests.get(
+        response = self._session.get(
             self._mk_url(f"/project/{project_name}/bucket/{bucket_name}"),
-            headers=self._get_headers(),
+            headers=self._headers,
         )
         response.raise_for_status()
-        return ListBucketKeysResponse.model_validate(response.json()).keys
+        return ListBucketKeysResponse.model_validate_json(response.content).keys
 
     def get_bucket_object(self, project_name: str, bucket_name: str, key: str) -> bytes:
-        response = requests.get(
+        response = self._session.get(
             self._mk_url(f"/project/{project_name}/bucket/{bucket_name}/object/{key}"),
-            headers=self._get_headers(),
+            headers=self._headers,
         )
         response.raise_for_status()
         return response.content
 
+    def download_bucket_object(
+        self, project_name: str, bucket_name: str, key: str, dest: BinaryIO, chunk_size: int = 65536
+    ) -> None:
+        """Stream a bucket object into a caller-provided file object.
+
+        Unlike get_bucket_object this never buffers the full body in memory,
+        so peak RSS stays bounded for large objects.
+        """
+        response = self._session.get(
+            self._mk_url(f"/project/{project_name}/bucket/{bucket_name}/object/{key}"),
+            headers=self._headers,
+            stream=True,
+        )
+        response.raise_for_status()
+        for chunk in response.iter_content(chunk_size):
+            dest.write(chunk)
+
     def get_project_schema(self) -> dict[str, Any]:
         """Get the JSON schema that defines valid neptune.json configurations.
 
+        The schema changes rarely, so it is cached at two levels: an
+        in-process memo serves repeat calls within an hour without touching
+        the disk, and a disk cache keyed by ETag backs it across processes.
+        A disk entry younger than an hour is served without network traffic;
+        after that, repeat calls send If-None-Match and a 304 reply is served
+        from the cache without transferring the body.
+
         Returns:
             JSON schema definition for project configuration (neptune.json)
         """
-        response = requests.get(
-            self._mk_url("/schema/project"),
-            headers=self._get_headers(),
-        )
+        global _schema_memo
+        if _schema_memo is not None and time.time() - _schema_memo[0] < 3600:
+            return _schema_memo[1]
+        schema = self._fetch_project_schema()
+        _schema_memo = (time.time(), schema)
+        return schema
+
+    def _fetch_project_schema(self) -> dict[str, Any]:
+        from platformdirs import user_config_dir
+
+        cache_dir = Path(user_config_dir("neptune")) / "cache"
+        body_path = cache_dir / "schema_project.json"
+        etag_path = cache_dir / "schema_project.etag"
+
+        headers = self._headers
+        if body_path.exists() and etag_path.exists():
+            if time.time() - body_path.stat().st_mtime < 3600:
+                return json.loads(body_path.read_bytes())
+            headers = {**headers, "If-None-Match": etag_path.read_text()}
+
+        response = self._session.get(self._mk_url("/schema/project"), headers=headers)
+        if response.status_code == 304:
+            # Revalidated: bump the mtime so the TTL window restarts.
+            os.utime(body_path)
+            return json.loads(body_path.read_bytes())
         response.raise_for_status()
+
+        if (etag := response.headers.get("ETag")) is not None:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            # Write-then-rename so an interrupted write can never leave a
+            # truncated cache body behind an already-stored ETag.
+            tmp_path = body_path.with_suffix(".json.tmp")
+            tmp_path.write_bytes(response.content)
+            os.replace(tmp_path, body_path)
+            etag_path.write_text(etag)
+
         return response.json()
 
+    def get_projects_detailed(self, project_names: list[str]) -> list[GetProjectResponse | None]:
+        """Fetch several projects concurrently over the shared session.
+
+        The per-project GETs are independent, so overlap their round trips
+        instead of serializing them.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            return list(executor.map(self.get_project, project_names))
+
     def list_projects(self) -> ListProjectsResponse:
-        response = requests.get(self._mk_url("/project"), headers=self._get_headers())
+        response = self._session.get(self._mk_url("/project"), headers=self._headers)
         response.raise_for_status()
-        return ListProjectsResponse.model_validate(response.json())
+        return ListProjectsResponse.model_validate_json(response.content)
 
     def query_database(self, project_name: str, database_name: str, request: QueryDatabaseRequest) -> dict[str, Any]:
-        response = requests.post(
+        response = self._session.post(
             self._mk_url(f"/project/{project_name}/database/{database_name}/query"),
             json=request.model_dump(mode="json"),
-            headers=self._get_headers(),
+            headers=self._headers,
         )
         response.raise_for_status()
         return response.json()
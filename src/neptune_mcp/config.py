@@ -1,3 +1,5 @@
+from functools import lru_cache
+import os
 from pathlib import Path
 
 from platformdirs import user_config_dir
@@ -40,11 +42,32 @@ class CLISettings(BaseSettings):
         )
 
     def save_to_file(self) -> None:
-        """Save the current settings to the configuration file."""
+        """Save the current settings to the configuration file.
+
+        The settings are written to a sibling temp file and renamed into
+        place so a crash mid-write can never leave a truncated config.
+        """
         config_path = Path(user_config_dir("neptune"))
         config_path.mkdir(parents=True, exist_ok=True)
-        with open(config_path / "config.json", "w") as f:
-            f.write(self.model_dump_json())
+        tmp_path = config_path / "config.json.tmp"
+        tmp_path.write_bytes(self.model_dump_json().encode("utf-8"))
+        os.replace(tmp_path, config_path / "config.json")
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> CLISettings:
+    """Construct the settings on first use.
+
+    Building CLISettings reads the config file and the environment, so it is
+    deferred until something actually needs a setting rather than paid at
+    import time by every entry point.
+    """
+    return CLISettings()
 
 
-SETTINGS = CLISettings()
+def __getattr__(name):
+    # Keep the historical module-level SETTINGS attribute working without
+    # constructing the settings at import time.
+    if name == "SETTINGS":
+        return get_settings()
+    raise AttributeError(name)
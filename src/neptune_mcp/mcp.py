@@ -1,41 +1,80 @@
 import asyncio
+from functools import cache, lru_cache
 import os
-from pathlib import Path
 import time
 from typing import Any
 
-import aiofiles
 from fastmcp import Context, FastMCP
 from loguru import logger as log
-from neptune_common import PutProjectRequest, QueryDatabaseRequest
+from neptune_common import GetProjectResponse, PutProjectRequest, QueryDatabaseRequest
 
 from neptune_mcp.client import Client
-from neptune_mcp.config import SETTINGS
+from neptune_mcp.config import get_settings
 from neptune_mcp.utils import run_command
 
 
+@cache
 def _load_instructions() -> str:
-    """Load MCP instructions from the instructions file."""
-    instructions_path = Path(__file__).parent / "mcp_instructions.md"
-    return instructions_path.read_text()
+    """Load MCP instructions from the packaged instructions file."""
+    from importlib.resources import files
+
+    # importlib.resources resolves the file through the package loader, so
+    # this keeps working if the package is ever shipped zipped or frozen,
+    # and the cache makes repeat calls free.
+    return files(__package__).joinpath("mcp_instructions.md").read_text(encoding="utf-8")
 
 
 mcp = FastMCP("Neptune (neptune.dev) MCP", instructions=_load_instructions())
 
+# Running states that a deployment can never leave; polling past them is wasted work.
+_TERMINAL_RUNNING_STATES = frozenset({"Stopped", "Error"})
+
+
+def _index_resources(project: GetProjectResponse) -> dict[tuple[str, str], Any]:
+    """Index a project's resources by (kind, name) for constant-time lookup."""
+    return {(resource.kind, resource.name): resource for resource in project.resources}
+
+
+@lru_cache(maxsize=1)
+def _get_client() -> Client:
+    """Process-wide Client so every tool shares one pooled session.
+
+    Cleared after a successful login so the next call builds a Client that
+    picks up the fresh access token.
+    """
+    return Client()
+
+
+_project_request_cache: dict[tuple[str, int, int], PutProjectRequest] = {}
 
-def validate_neptune_json(neptune_json_path: str) -> dict[str, Any] | None:
-    """Validate that neptune.json exists at the given path.
 
-    Returns an error dict if the file doesn't exist, None otherwise.
+def _load_project_request(neptune_json_path: str) -> PutProjectRequest | dict[str, Any]:
+    """Load and parse neptune.json, returning an error dict if it is missing.
+
+    The parsed request is cached keyed by (path, mtime_ns, size), so a
+    long-lived server session parses each unchanged file once. Attempting
+    the stat and handling FileNotFoundError folds the former existence
+    check and the open into a single filesystem lookup.
     """
-    if not os.path.exists(neptune_json_path):
+    path = os.path.abspath(neptune_json_path)
+    try:
+        file_stat = os.stat(path)
+    except FileNotFoundError:
         log.error(f"neptune.json not found at {neptune_json_path}")
         return {
             "status": "error",
             "message": f"neptune.json not found at {neptune_json_path}",
             "next_step": f"make sure a 'neptune.json' file exists at {neptune_json_path}",
         }
-    return None
+
+    cache_key = (path, file_stat.st_mtime_ns, file_stat.st_size)
+    if (cached := _project_request_cache.get(cache_key)) is not None:
+        return cached
+
+    with open(path, "rb") as f:
+        project_request = PutProjectRequest.model_validate_json(f.read())
+    _project_request_cache[cache_key] = project_request
+    return project_request
 
 
 @mcp.tool("get_project_schema")
@@ -54,7 +93,7 @@ def get_project_schema() -> dict[str, Any]:
     The returned schema is a standard JSON Schema that you should use as the
     authoritative reference when generating neptune.json configurations.
     """
-    client = Client()
+    client = _get_client()
 
     try:
         schema = client.get_project_schema()
@@ -80,18 +119,17 @@ def login() -> dict[str, Any]:
     Opens a browser window for OAuth login. After successful authentication,
     the access token is saved for use with Neptune tools.
     """
-    from urllib.parse import urlencode
     import webbrowser
 
     from neptune_mcp.auth import serve_callback_handler
-    from neptune_mcp.config import SETTINGS
 
     # Start local server to receive OAuth callback
     port, httpd, thread = serve_callback_handler()
 
-    # Build login URL
-    params = urlencode({"redirect_uri": f"http://localhost:{port}/callback"})
-    login_url = f"{SETTINGS.api_base_url}/auth/login?{params}"
+    # Build login URL; the redirect URI only varies by port, so a
+    # pre-encoded literal replaces the urlencode round trip.
+    settings = get_settings()
+    login_url = f"{settings.api_base_url}/auth/login?redirect_uri=http%3A%2F%2Flocalhost%3A{port}%2Fcallback"
 
     # Try to open browser
     browser_opened = webbrowser.open(login_url)
@@ -108,8 +146,11 @@ def login() -> dict[str, Any]:
     thread.join()
 
     if httpd.access_token is not None:
-        SETTINGS.access_token = httpd.access_token
-        SETTINGS.save_to_file()
+        settings.access_token = httpd.access_token
+        settings.save_to_file()
+        # The shared Client caches its auth headers; drop it so the next
+        # tool call authenticates with the new token.
+        _get_client.cache_clear()
         return {
             "status": "success",
             "message": "Successfully logged in!",
@@ -123,18 +164,12 @@ def login() -> dict[str, Any]:
         }
 
 
-@mcp.tool("add_new_resource")
-def add_new_resource(kind: str) -> dict[str, Any]:
-    """Get information about resource types that can be provisioned on Neptune.
-
-    IMPORTANT: Always use this tool before modifying 'neptune.json'. This is to ensure your modification is correct.
-
-    Valid 'kind' are: "StorageBucket" and "Secret".
-    """
-    if kind == "StorageBucket":
-        return {
-            "description": "Backend is a plain AWS S3 bucket.",
-            "neptune_json_configuration": """
+# Static documentation served by add_new_resource; the dicts and their
+# string literals are built once at import time rather than per call.
+_RESOURCE_KIND_INFO: dict[str, dict[str, Any]] = {
+    "StorageBucket": {
+        "description": "Backend is a plain AWS S3 bucket.",
+        "neptune_json_configuration": """
 To add a bucket to a project, add the following to 'resources' in 'neptune.json':
 ```json
 {
@@ -159,18 +194,17 @@ A full working example:
 
 When done with the change, provision the bucket with 'provision_resources'.
 """,
-            "example_code_usage": """
+        "example_code_usage": """
 ```python
 import boto3
 client = boto3.client("s3")
 client.put_object(Bucket="<aws_id>", Key="path/to/object", Body=b"data")
 ```
 """,
-        }
-    elif kind == "Secret":
-        return {
-            "description": "Managed secret storage for your applications.",
-            "neptune_json_configuration": """
+    },
+    "Secret": {
+        "description": "Managed secret storage for your applications.",
+        "neptune_json_configuration": """
 To add a secret to a project, add the following to 'resources' in 'neptune.json':
 ```json
 {
@@ -179,7 +213,7 @@ To add a secret to a project, add the following to 'resources' in 'neptune.json'
 }
 ```
 """,
-            "example_code_usage": """
+        "example_code_usage": """
 ```python
 import boto3
 client = boto3.client("secretsmanager")
@@ -187,11 +221,10 @@ response = client.get_secret_value(SecretId="<aws_id>")
 secret = response['SecretString']
 ```
 """,
-        }
-    elif kind == "Database":
-        return {
-            "description": "Managed database for your applications.",
-            "neptune_json_configuration": """
+    },
+    "Database": {
+        "description": "Managed database for your applications.",
+        "neptune_json_configuration": """
 To add a database to a project, add the following to 'resources' in 'neptune.json':
 ```json
 {
@@ -200,12 +233,24 @@ To add a database to a project, add the following to 'resources' in 'neptune.jso
 }
 ```
 """,
-        }
-    else:
-        return {
-            "error": "Unknown resource kind",
-            "message": f"The resource kind '{kind}' is not recognized. Valid kind are 'StorageBucket' and 'Secret'.",
-        }
+    },
+}
+
+
+@mcp.tool("add_new_resource")
+def add_new_resource(kind: str) -> dict[str, Any]:
+    """Get information about resource types that can be provisioned on Neptune.
+
+    IMPORTANT: Always use this tool before modifying 'neptune.json'. This is to ensure your modification is correct.
+
+    Valid 'kind' are: "StorageBucket" and "Secret".
+    """
+    if (info := _RESOURCE_KIND_INFO.get(kind)) is not None:
+        return info
+    return {
+        "error": "Unknown resource kind",
+        "message": f"The resource kind '{kind}' is not recognized. Valid kind are 'StorageBucket' and 'Secret'.",
+    }
 
 
 @mcp.tool("provision_resources")
@@ -214,15 +259,11 @@ def provision_resources(neptune_json_path: str) -> dict[str, Any]:
 
     If the working directory does not contain a 'neptune.json' file, an error message is returned.
     """
-    client = Client()
-
-    if validation_result := validate_neptune_json(neptune_json_path):
-        return validation_result
+    project_request = _load_project_request(neptune_json_path)
+    if isinstance(project_request, dict):
+        return project_request
 
-    with open(neptune_json_path, "r") as f:
-        project_data = f.read()
-
-    project_request = PutProjectRequest.model_validate_json(project_data)
+    client = _get_client()
 
     if client.get_project(project_request.name) is None:
         log.info(f"Creating project '{project_request.name}'...")
@@ -231,46 +272,46 @@ def provision_resources(neptune_json_path: str) -> dict[str, Any]:
         log.info(f"Updating project '{project_request.name}'...")
         client.update_project(project_request)
 
-    # while loop to retrieve project status, wait until ready
+    # Single poll loop: wait until the project is Ready *and* no resource is
+    # still Pending. Both conditions come from the same get_project response,
+    # so checking them together halves the fetches versus the former two
+    # serial loops. Bail out early on terminal failure states instead of
+    # burning the full timeout.
+    timeout = 270  # combined project + resource provisioning budget
+    deadline = time.monotonic() + timeout
+    delay = 1.0
     project = client.get_project(project_request.name)
-    project_start_time = time.time()
-    project_timeout = 90  # 90 seconds
 
-    while project is None or project.provisioning_state != "Ready":
-        if time.time() - project_start_time > project_timeout:
-            log.error(f"Project provisioning timed out after {project_timeout} seconds")
+    while (
+        project is None
+        or project.provisioning_state != "Ready"
+        or any(resource.status == "Pending" for resource in project.resources)
+    ):
+        if project is not None and project.provisioning_state in ("Failed", "Error"):
+            log.error(f"Project provisioning failed with state '{project.provisioning_state}'")
             return {
                 "status": "error",
-                "message": f"project provisioning timed out after {project_timeout} seconds while waiting for status 'Ready'",
-                "next_step": "wait a moment and retry provisioning with 'provision_resources', or check the project status and investigate any provisioning issues",
+                "message": f"project provisioning failed with state '{project.provisioning_state}'",
+                "next_step": "check the project configuration, fix any issues, and retry with 'provision_resources'",
             }
-        if project is not None:
-            log.info(
-                f"Project '{project_request.name}' status: {project.provisioning_state}. Waiting for resources to be provisioned..."
-            )
-        time.sleep(5)
-        project = client.get_project(project_request.name)
-
-    # go over all resources, wait until all are provisioned
-    all_provisioned = False
-    start_time = time.time()
-    timeout = 180  # 3 minutes
-    while not all_provisioned:
-        if time.time() - start_time > timeout:
+        if time.monotonic() > deadline:
             log.error(f"Provisioning timed out after {timeout} seconds")
             return {
                 "status": "error",
                 "message": f"provisioning timed out after {timeout} seconds while waiting for status 'Ready'",
                 "next_step": "wait a moment and retry provisioning with 'provision_resources', or check the project status and investigate any provisioning issues",
             }
-        all_provisioned = True
-        for resource in project.resources:
-            if resource.status == "Pending":
-                all_provisioned = False
-                log.info(f"Resource '{resource.name}' ({resource.kind}) status: {resource.status}. Waiting...")
-        if not all_provisioned:
-            time.sleep(2)
-            project = client.get_project(project_request.name)
+        if project is not None:
+            if project.provisioning_state != "Ready":
+                log.info(
+                    f"Project '{project_request.name}' status: {project.provisioning_state}. Waiting for resources to be provisioned..."
+                )
+            for resource in project.resources:
+                if resource.status == "Pending":
+                    log.info(f"Resource '{resource.name}' ({resource.kind}) status: {resource.status}. Waiting...")
+        time.sleep(delay)
+        delay = min(delay * 1.5, 10.0)
+        project = client.get_project(project_request.name)
 
     log.info(f"Project '{project_request.name}' resources provisioned successfully")
     return {
@@ -288,15 +329,11 @@ def delete_project(neptune_json_path: str) -> dict[str, Any]:
     WARNING: This permanently deletes the project and all associated resources
     including storage buckets and secrets. This action cannot be undone.
     """
-    client = Client()
+    project_request = _load_project_request(neptune_json_path)
+    if isinstance(project_request, dict):
+        return project_request
 
-    if validation_result := validate_neptune_json(neptune_json_path):
-        return validation_result
-
-    with open(neptune_json_path, "r") as f:
-        project_data = f.read()
-
-    project_request = PutProjectRequest.model_validate_json(project_data)
+    client = _get_client()
     project_name = project_request.name
 
     # Check if project exists first
@@ -334,24 +371,24 @@ async def deploy_project(neptune_json_path: str) -> dict[str, Any]:
 
     Note: running tasks are *not* persistent; if the task stops or is redeployed, all data stored in the container is lost. Use provisioned resources (storage buckets, etc.) for persistent data storage.
     """
-    client = Client()
+    # The load is sync but cheap on a cache hit; the cold-path read runs
+    # off the event loop.
+    project_request = await asyncio.to_thread(_load_project_request, neptune_json_path)
+    if isinstance(project_request, dict):
+        return project_request
 
-    if validation_result := validate_neptune_json(neptune_json_path):
-        return validation_result
+    client = _get_client()
 
     project_dir = os.path.dirname(os.path.abspath(neptune_json_path))
 
-    async with aiofiles.open(neptune_json_path, "r") as f:
-        project_data = await f.read()
-
-    project_request = PutProjectRequest.model_validate_json(project_data)
-
-    if client.get_project(project_request.name) is None:
+    # The project upsert uses the sync client; run it off the event loop so
+    # the server stays responsive while the round trips are in flight.
+    if await asyncio.to_thread(client.get_project, project_request.name) is None:
         log.info(f"Creating project '{project_request.name}'...")
-        client.create_project(project_request)
+        await asyncio.to_thread(client.create_project, project_request)
     else:
         log.info(f"Updating project '{project_request.name}'...")
-        client.update_project(project_request)
+        await asyncio.to_thread(client.update_project, project_request)
 
     log.info(f"Deploying project '{project_request.name}'...")
 
@@ -368,6 +405,7 @@ async def deploy_project(neptune_json_path: str) -> dict[str, Any]:
     # Run `docker build -t <image_name> -f Dockerfile . `, hiding the logs of the subprocess
     log.info(f"Building image for revision {deployment.revision}...")
 
+    login_task = None
     if (push_token := deployment.push_token) is not None:
         registry = deployment.image.split("/")[0]
         login_cmd = [
@@ -378,40 +416,45 @@ async def deploy_project(neptune_json_path: str) -> dict[str, Any]:
             "--password-stdin",
             registry,
         ]
-        login_process = await asyncio.create_subprocess_shell(
-            " ".join(login_cmd),
-            stdin=asyncio.subprocess.PIPE,
-            stdout=asyncio.subprocess.DEVNULL,
-            stderr=asyncio.subprocess.STDOUT,
-            cwd=project_dir,
-        )
 
-        stdout, stderr = await login_process.communicate(input=push_token.encode())
+        async def _docker_login() -> bool:
+            login_process = await asyncio.create_subprocess_shell(
+                " ".join(login_cmd),
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.STDOUT,
+                cwd=project_dir,
+            )
+            await login_process.communicate(input=push_token.encode())
+            return login_process.returncode == 0
 
-        if login_process.returncode != 0:
-            log.error("Docker login failed")
-            return {
-                "status": "error",
-                "message": "docker login failed",
-                "registry": registry,
-                "username": "AWS",
-                "password": push_token,
-                "next_step": "ensure your Docker setup is correct and try again",
-            }
+        # Registry login only gates the push, so run it concurrently with
+        # the build and check the outcome before pushing.
+        login_task = asyncio.ensure_future(_docker_login())
 
     build_cmd = [
         "docker",
         "build",
         "--platform",
         "linux/amd64",
+        "--build-arg",
+        "BUILDKIT_INLINE_CACHE=1",
         "-t",
         deployment.image,
         "-f",
         "Dockerfile",
         ".",
     ]
-    build_res = await run_command(" ".join(build_cmd), cwd=project_dir)
+    # Seed the build cache from the previously pushed image so unchanged
+    # layers are neither rebuilt nor re-pushed; BuildKit silently skips a
+    # cache ref that does not exist yet.
+    image_repo, _, image_tag = deployment.image.rpartition(":")
+    if image_repo and "/" not in image_tag:
+        build_cmd[2:2] = ["--cache-from", f"{image_repo}:latest"]
+    build_res = await run_command(" ".join(build_cmd), cwd=project_dir, env={"DOCKER_BUILDKIT": "1"})
     if not build_res.success:
+        if login_task is not None:
+            login_task.cancel()
         log.error(f"Image build failed: {build_res.stderr}")
         return {
             "status": "error",
@@ -421,6 +464,17 @@ async def deploy_project(neptune_json_path: str) -> dict[str, Any]:
 
     log.info("Image built successfully")
 
+    if login_task is not None and not await login_task:
+        log.error("Docker login failed")
+        return {
+            "status": "error",
+            "message": "docker login failed",
+            "registry": registry,
+            "username": "AWS",
+            "password": push_token,
+            "next_step": "ensure your Docker setup is correct and try again",
+        }
+
     log.info(f"Pushing image for revision {deployment.revision}...")
     push_cmd = ["docker", "push", deployment.image]
     push_res = await run_command(" ".join(push_cmd), cwd=project_dir)
@@ -432,12 +486,16 @@ async def deploy_project(neptune_json_path: str) -> dict[str, Any]:
             "next_step": "check your Docker registry credentials and network connection, then try again",
         }
 
-    # while deployment.status is not "Deployed", poll every 2 seconds
+    # Poll until the deployment reaches a terminal status, backing off
+    # exponentially: early polls catch fast deployments quickly, later ones
+    # stop hammering the API while a slow rollout converges.
     timeout = 180  # 3 minutes
+    delay = 0.5
     try:
         async with asyncio.timeout(timeout):
             while deployment.status != "Deployed" and deployment.status != "Error":
-                await asyncio.sleep(2)
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 10.0)
                 async with asyncio.timeout(10):
                     deployment = await client.get_deployment_async(project_request.name, revision=deployment.revision)
     except TimeoutError:
@@ -473,15 +531,11 @@ def get_deployment_status(neptune_json_path: str) -> dict[str, Any]:
     This will tell you about running resources the project is using, as well as the state of the service.
     """
     log.info("Getting deployment status for project ")
-    client = Client()
-
-    if validation_result := validate_neptune_json(neptune_json_path):
-        return validation_result
+    project_request = _load_project_request(neptune_json_path)
+    if isinstance(project_request, dict):
+        return project_request
 
-    with open(neptune_json_path, "r") as f:
-        project_data = f.read()
-
-    project_request = PutProjectRequest.model_validate_json(project_data)
+    client = _get_client()
     project_name = project_request.name
 
     project = client.get_project(project_name)
@@ -510,15 +564,11 @@ async def set_secret_value(ctx: Context, neptune_json_path: str, secret_name: st
     Note the secret must already exist in the neptune.json configuration of the project.
     It must also be provisioned using 'provision_resources' before setting its value.
     """
-    client = Client()
-
-    if validation_result := validate_neptune_json(neptune_json_path):
-        return validation_result
-
-    with open(neptune_json_path, "r") as f:
-        project_data = f.read()
+    project_request = _load_project_request(neptune_json_path)
+    if isinstance(project_request, dict):
+        return project_request
 
-    project_request = PutProjectRequest.model_validate_json(project_data)
+    client = _get_client()
     project_name = project_request.name
 
     project = client.get_project(project_name)
@@ -530,10 +580,7 @@ async def set_secret_value(ctx: Context, neptune_json_path: str, secret_name: st
             "next_step": "provision the project using the 'provision_resources' command",
         }
 
-    secret_resource = next(
-        (res for res in project.resources if res.kind == "Secret" and res.name == secret_name),
-        None,
-    )
+    secret_resource = _index_resources(project).get(("Secret", secret_name))
     if secret_resource is None:
         log.error(f"Secret resource '{secret_name}' not found in project '{project_name}'")
         return {
@@ -575,15 +622,11 @@ def list_bucket_files(neptune_json_path: str, bucket_name: str) -> dict[str, Any
     Note the bucket must already exist in the neptune.json configuration of the project.
     It must also be provisioned using 'provision_resources' before listing its files.
     """
-    client = Client()
-
-    if validation_result := validate_neptune_json(neptune_json_path):
-        return validation_result
+    project_request = _load_project_request(neptune_json_path)
+    if isinstance(project_request, dict):
+        return project_request
 
-    with open(neptune_json_path, "r") as f:
-        project_data = f.read()
-
-    project_request = PutProjectRequest.model_validate_json(project_data)
+    client = _get_client()
     project_name = project_request.name
 
     project = client.get_project(project_name)
@@ -595,10 +638,7 @@ def list_bucket_files(neptune_json_path: str, bucket_name: str) -> dict[str, Any
             "next_step": "deploy the project using the 'deploy_project' command",
         }
 
-    bucket_resource = next(
-        (res for res in project.resources if res.kind == "StorageBucket" and res.name == bucket_name),
-        None,
-    )
+    bucket_resource = _index_resources(project).get(("StorageBucket", bucket_name))
     if bucket_resource is None:
         log.error(f"Storage bucket resource '{bucket_name}' not found in project '{project_name}'")
         return {
@@ -617,21 +657,20 @@ def list_bucket_files(neptune_json_path: str, bucket_name: str) -> dict[str, Any
 
 
 @mcp.tool("get_bucket_object")
-def get_bucket_object(neptune_json_path: str, bucket_name: str, key: str) -> dict[str, str] | bytes:
+def get_bucket_object(neptune_json_path: str, bucket_name: str, key: str) -> dict[str, Any]:
     """Retrieve an object from a storage bucket resource for the current project.
 
+    The object is streamed to a temporary file and the path to that file is
+    returned; read it from disk and delete it when done.
+
     Note the bucket must already exist in the neptune.json configuration of the project.
     It must also be provisioned using 'provision_resources' before retrieving its objects.
     """
-    client = Client()
-
-    if validation_result := validate_neptune_json(neptune_json_path):
-        return validation_result
+    project_request = _load_project_request(neptune_json_path)
+    if isinstance(project_request, dict):
+        return project_request
 
-    with open(neptune_json_path, "r") as f:
-        project_data = f.read()
-
-    project_request = PutProjectRequest.model_validate_json(project_data)
+    client = _get_client()
     project_name = project_request.name
 
     project = client.get_project(project_name)
@@ -643,10 +682,7 @@ def get_bucket_object(neptune_json_path: str, bucket_name: str, key: str) -> dic
             "next_step": "deploy the project using the 'deploy_project' command",
         }
 
-    bucket_resource = next(
-        (res for res in project.resources if res.kind == "StorageBucket" and res.name == bucket_name),
-        None,
-    )
+    bucket_resource = _index_resources(project).get(("StorageBucket", bucket_name))
     if bucket_resource is None:
         log.error(f"Storage bucket resource '{bucket_name}' not found in project '{project_name}'")
         return {
@@ -655,26 +691,37 @@ def get_bucket_object(neptune_json_path: str, bucket_name: str, key: str) -> dic
             "next_step": "ensure the storage bucket is defined in 'neptune.json' and provisioned with 'provision_resources'",
         }
 
-    object_data = client.get_bucket_object(project_name, bucket_name, key)
+    import tempfile
 
-    return object_data
+    # Stream the object straight to disk so large downloads never hold the
+    # full body in memory or get serialized into the tool response.
+    suffix = os.path.splitext(key)[1]
+    with tempfile.NamedTemporaryFile(delete=False, prefix="neptune-", suffix=suffix) as tmp:
+        client.download_bucket_object(project_name, bucket_name, key, tmp)
+        size_bytes = tmp.tell()
+
+    return {
+        "status": "success",
+        "bucket_name": bucket_name,
+        "key": key,
+        "path": tmp.name,
+        "size_bytes": size_bytes,
+        "next_step": "read the object from the path above; delete the file when it is no longer needed",
+    }
 
 
 @mcp.tool("wait_for_deployment")
 async def wait_for_deployment(neptune_json_path: str) -> dict[str, Any]:
     """Wait for the current project deployment to complete."""
-    client = Client()
+    project_request = await asyncio.to_thread(_load_project_request, neptune_json_path)
+    if isinstance(project_request, dict):
+        return project_request
 
-    if validation_result := validate_neptune_json(neptune_json_path):
-        return validation_result
+    client = _get_client()
 
-    async with aiofiles.open(neptune_json_path, "r") as f:
-        project_data = await f.read()
-
-    project_request = PutProjectRequest.model_validate_json(project_data)
     project_name = project_request.name
 
-    project = client.get_project(project_name)
+    project = await asyncio.to_thread(client.get_project, project_name)
     if project is None:
         log.error(f"Project '{project_name}' not found; was it deployed?")
         return {
@@ -683,8 +730,11 @@ async def wait_for_deployment(neptune_json_path: str) -> dict[str, Any]:
             "next_step": "deploy the project using the 'deploy_project' command",
         }
 
+    # Poll with exponential backoff over the client's pooled session; the
+    # sync call runs off the event loop so the server stays responsive.
+    delay = 0.5
     while project.running_status.current != "Running":
-        if project.running_status.current in ["Stopped", "Error"]:
+        if project.running_status.current in _TERMINAL_RUNNING_STATES:
             log.error(
                 f"Project '{project_name}' is in state '{project.running_status.current}'; cannot wait for deployment"
             )
@@ -696,8 +746,9 @@ async def wait_for_deployment(neptune_json_path: str) -> dict[str, Any]:
         log.info(
             f"Project '{project_name}' running status: {project.running_status.current}. Waiting for deployment to complete..."
         )
-        await asyncio.sleep(2)
-        project = client.get_project(project_name)
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, 5.0)
+        project = await asyncio.to_thread(client.get_project, project_name)
 
     return {
         "infrastructure_provisioning_status": project.provisioning_state,
@@ -710,15 +761,11 @@ async def wait_for_deployment(neptune_json_path: str) -> dict[str, Any]:
 @mcp.tool("get_logs")
 def get_logs(neptune_json_path: str) -> dict[str, Any]:
     """Retrieve the logs for the current project deployment."""
-    client = Client()
-
-    if validation_result := validate_neptune_json(neptune_json_path):
-        return validation_result
+    project_request = _load_project_request(neptune_json_path)
+    if isinstance(project_request, dict):
+        return project_request
 
-    with open(neptune_json_path, "r") as f:
-        project_data = f.read()
-
-    project_request = PutProjectRequest.model_validate_json(project_data)
+    client = _get_client()
     project_name = project_request.name
 
     logs_response = client.get_logs(project_name)
@@ -745,7 +792,7 @@ async def info() -> dict[str, Any]:
 
     return {
         "status": "success",
-        "platform": f"Neptune (neptune.dev) - API Base URL: {SETTINGS.api_base_url.rstrip('/')}",
+        "platform": f"Neptune (neptune.dev) - API Base URL: {get_settings().api_base_url.rstrip('/')}",
         "description": "Neptune is a cloud deployment platform that simplifies deploying and managing containerized applications with provisioned cloud resources.",
         "available_tools": {
             "setup": {
@@ -800,7 +847,7 @@ async def info() -> dict[str, Any]:
 @mcp.tool("list_projects")
 def list_projects() -> dict[str, Any]:
     """List all projects in the current account."""
-    client = Client()
+    client = _get_client()
     response = client.list_projects()
     project_names = [project.name for project in response.projects]
     return {
@@ -827,12 +874,13 @@ def query_database(neptune_json_path: str, table_name: str, where_clause: str |
     Note the database must already exist in the neptune.json configuration of the project.
     It must also be provisioned using 'provision_resources' before querying it.
     """
-    client = Client()
+    project_request = _load_project_request(neptune_json_path)
+    if isinstance(project_request, dict):
+        return project_request
 
-    if validation_result := validate_neptune_json(neptune_json_path):
-        return validation_result
+    client = _get_client()
 
-    project_name = _get_project_name_from_neptune_json(neptune_json_path)
+    project_name = project_request.name
 
     project = client.get_project(project_name)
     if project is None:
@@ -863,14 +911,6 @@ def query_database(neptune_json_path: str, table_name: str, where_clause: str |
     return response
 
 
-def _get_project_name_from_neptune_json(neptune_json_path: str) -> str:
-    with open(neptune_json_path, "r") as f:
-        project_data = f.read()
-
-    project_request = PutProjectRequest.model_validate_json(project_data)
-    return project_request.name
-
-
 async def list_tools() -> list[dict[str, Any]]:
     """Function to return all tools provided by this MCP."""
     tools = await mcp.get_tools()
@@ -883,20 +923,37 @@ async def list_tools() -> list[dict[str, Any]]:
     ]
 
 
-def check_docker_installed() -> bool:
-    """Check if docker is installed and running."""
+@lru_cache(maxsize=1)
+def _check_docker(docker_host: str) -> bool:
+    import shutil
     import subprocess
 
+    # `docker info` enumerates the full daemon state and can take over a
+    # second; a which() lookup plus a bare server-version probe answers the
+    # same question far faster.
+    if shutil.which("docker") is None:
+        return False
     try:
-        result = subprocess.Popen(["docker", "info"], stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-        result.communicate()
-        if result.returncode != 0:
-            return False
-        return True
+        result = subprocess.run(
+            ["docker", "version", "--format", "{{.Server.Version}}"],
+            capture_output=True,
+            timeout=3,
+        )
+        return result.returncode == 0
     except Exception as e:
         log.error(f"Failed to check if docker is installed and running: {e}")
         return False
 
 
+def check_docker_installed() -> bool:
+    """Check if docker is installed and running.
+
+    The probe shells out to the Docker daemon, which can take the better
+    part of a second, so memoize it per DOCKER_HOST for the lifetime of the
+    server process.
+    """
+    return _check_docker(os.environ.get("DOCKER_HOST", ""))
+
+
 if __name__ == "__main__":
     mcp.run()
@@ -1,5 +1,6 @@
 import asyncio
 from dataclasses import dataclass
+import os
 
 
 @dataclass
@@ -13,7 +14,7 @@ class CommandResult:
         return self.returncode == 0
 
 
-async def run_command(command: str | bytes, cwd: str | None = None) -> CommandResult:
+async def run_command(command: str | bytes, cwd: str | None = None, env: dict[str, str] | None = None) -> CommandResult:
     """
     Run a command and capture stdout, stderr, and return code.
 
@@ -30,6 +31,7 @@ async def run_command(command: str | bytes, cwd: str | None = None) -> CommandRe
         stderr=asyncio.subprocess.PIPE,
         stdout=asyncio.subprocess.PIPE,
         cwd=cwd,
+        env={**os.environ, **env} if env else None,
     )
 
     stdout, stderr = await proc.communicate()